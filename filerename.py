@@ -1,9 +1,17 @@
 import os
+import stat
 import datetime
 import sys
 import argparse
+import io
 import json
-import re
+import struct
+import atexit
+import collections
+import itertools
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 # Script info
@@ -43,12 +51,30 @@ except ImportError:
         RESET_ALL = ''
 
 # Supported image extensions
-IMAGE_EXTENSIONS = {
-    # Common formats (Pillow)
-    '.jpg', '.jpeg', '.png', '.tiff', '.tif',
+RAW_EXTENSIONS = frozenset({
     # RAW formats (exifread)
     '.cr2', '.cr3', '.nef', '.arw', '.dng', '.orf', '.rw2', '.pef', '.srw', '.raf'
-}
+})
+IMAGE_EXTENSIONS = frozenset({
+    # Common formats (Pillow)
+    '.jpg', '.jpeg', '.png', '.tiff', '.tif',
+}) | RAW_EXTENSIONS
+
+# Metadata segments of JPEG files live at the start of the file, so exifread
+# only needs the first part of it (other formats may store IFDs anywhere)
+EXIFREAD_HEAD_BYTES = 131072
+
+# Batches with RAW files are read in a process pool (tag parsing is CPU-bound)
+# when at least this many files need reading
+PROCESS_POOL_MIN_FILES = 256
+PROCESS_POOL_MAX_WORKERS = 8
+PROCESS_POOL_CHUNKSIZE = 32
+
+# Files whose Date Taken is kept in memory for the rest of the run
+DATE_TAKEN_CACHE_SIZE = 65536
+
+# On-disk cache of files known to have no Date Taken, kept between runs
+NEG_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'filerename_neg.json')
 
 # Global options
 verbose_mode = False
@@ -57,6 +83,22 @@ safe_mode = False
 log_mode = False
 log_file_path = None
 
+# Date Taken already read this run {(path, size, mtime_ns): datetime or None},
+# least recently used first and bounded by DATE_TAKEN_CACHE_SIZE
+_date_taken_cache = collections.OrderedDict()
+# Negative cache {path: [size, mtime_ns]}, loaded on first use
+_neg_cache = None
+_neg_cache_dirty = False
+_neg_cache_lock = threading.Lock()
+# Directories walked this run; only their negative cache entries are pruned
+_neg_cache_roots = set()
+
+# Log file handle, opened once per run (line-buffered)
+_log_fh = None
+# Log entries waiting to be written by the background writer thread
+_log_queue = queue.Queue()
+_log_thread = None
+
 
 def print_verbose(message):
     """Print message only in verbose mode."""
@@ -95,41 +137,402 @@ def is_image_file(filepath):
     return ext in IMAGE_EXTENSIONS
 
 
+def iter_files(directory, extensions=None):
+    """
+    Recursively yield os.DirEntry objects for files under directory.
+    Uses os.scandir so file/dir checks come from the cached directory entry type.
+    extensions: optional set of lowercase extensions (with dot) to restrict to.
+    Files of a directory are yielded before its subdirectories are entered.
+    Symlinked directories are not followed (same as os.walk).
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError as e:
+        print_verbose(f"Cannot read directory {directory}: {e}")
+        return
+    
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                if extensions is None:
+                    yield entry
+                else:
+                    # Extension from the name only; a leading dot is not an extension
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot > 0 and name[dot:].lower() in extensions:
+                        yield entry
+        except OSError:
+            continue
+    
+    for subdir in subdirs:
+        yield from iter_files(subdir, extensions)
+
+
+def _parse_exif_dt(s):
+    """
+    Parse an EXIF date string ('YYYY:MM:DD HH:MM:SS', fixed width).
+    Raises ValueError if the fields are not valid numbers or not a valid date.
+    """
+    return datetime.datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                             int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
+
+def _find_ifd_tag(tiff, ifd_offset, tag, endian):
+    """
+    Find a tag in a TIFF IFD.
+    Returns (type, count, value_or_offset) tuple or None if not present.
+    """
+    (entry_count,) = struct.unpack_from(endian + 'H', tiff, ifd_offset)
+    pos = ifd_offset + 2
+    for _ in range(entry_count):
+        entry_tag, entry_type, count, value = struct.unpack_from(endian + 'HHII', tiff, pos)
+        if entry_tag == tag:
+            return (entry_type, count, value)
+        pos += 12
+    return None
+
+
+def _neg_cache_readers():
+    """Identify the available EXIF libraries; the negative cache is only valid for the same set."""
+    return [PIL_AVAILABLE, EXIFREAD_AVAILABLE]
+
+
+def _load_neg_cache():
+    """Load the negative cache from disk (once per run) and schedule saving it at exit."""
+    global _neg_cache
+    
+    with _neg_cache_lock:
+        if _neg_cache is None:
+            _neg_cache = {}
+            try:
+                with open(NEG_CACHE_PATH, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                # Files may have been skipped only because a library was missing
+                if data.get('readers') == _neg_cache_readers():
+                    _neg_cache = data.get('files', {})
+            except FileNotFoundError:
+                pass  # First run
+            except (OSError, ValueError, AttributeError) as e:
+                print_verbose(f"Negative cache not loaded: {e}")
+            atexit.register(_save_neg_cache)
+    return _neg_cache
+
+
+def _save_neg_cache():
+    """
+    Atomically write the negative cache to disk if it changed, dropping files
+    deleted from the directories walked this run.
+    """
+    if not _neg_cache_dirty:
+        return
+    
+    # Entries elsewhere are kept: they may be on a volume that is offline now
+    roots = tuple(os.path.join(root, '') for root in _neg_cache_roots)
+    files = {path: entry for path, entry in _neg_cache.items()
+             if not path.startswith(roots) or os.path.exists(path)}
+    
+    tmp_path = NEG_CACHE_PATH + '.tmp'
+    try:
+        os.makedirs(os.path.dirname(NEG_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'readers': _neg_cache_readers(), 'files': files}, f)
+        os.replace(tmp_path, NEG_CACHE_PATH)
+    except OSError as e:
+        print_verbose(f"Negative cache not saved: {e}")
+
+
+def _date_taken_key(filepath):
+    """
+    Build the cache key for filepath from a single stat call.
+    Returns tuple: (abspath, size, mtime_ns) or None if the file cannot be read.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError as e:
+        print_verbose(f"Cannot read {filepath}: {e}")
+        return None
+    return (os.path.abspath(filepath), st.st_size, st.st_mtime_ns)
+
+
+def _lookup_date_taken(key):
+    """
+    Look up a file in the in-memory cache and the on-disk negative cache.
+    Returns tuple: (found, date_taken)
+    """
+    if key in _date_taken_cache:
+        _date_taken_cache.move_to_end(key)
+        return (True, _date_taken_cache[key])
+    path, size, mtime_ns = key
+    if _load_neg_cache().get(path) == [size, mtime_ns]:
+        return (True, None)
+    return (False, None)
+
+
+def _store_date_taken(key, date_taken):
+    """
+    Remember a Date Taken result in the in-memory and on-disk negative caches.
+    date_taken: datetime, False if the file has no Date Taken, or None if it could
+    not be read (not cached, so the file is read again next time).
+    """
+    global _neg_cache_dirty
+    
+    if date_taken is None:
+        return
+    _date_taken_cache[key] = date_taken or None
+    _date_taken_cache.move_to_end(key)
+    if len(_date_taken_cache) > DATE_TAKEN_CACHE_SIZE:
+        _date_taken_cache.popitem(last=False)
+    neg_cache = _load_neg_cache()
+    path, size, mtime_ns = key
+    if date_taken is False:
+        neg_cache[path] = [size, mtime_ns]
+        _neg_cache_dirty = True
+    elif path in neg_cache:
+        # File changed and now has a Date Taken
+        neg_cache.pop(path, None)
+        _neg_cache_dirty = True
+
+
 def read_date_taken(filepath):
     """
     Extract 'Date Taken' (DateTimeOriginal) from image EXIF metadata.
+    Results are cached per (path, size, modified time), so a file is only read
+    once per run unless it changes (e.g. check followed by rename in the menu).
+    Files without a Date Taken are also remembered on disk between runs.
     Returns datetime object or None if not found.
     """
     filepath = os.path.normpath(filepath)
+    key = _date_taken_key(filepath)
+    if key is None:
+        return None
+    
+    found, date_taken = _lookup_date_taken(key)
+    if not found:
+        date_taken = _read_date_taken_uncached(filepath)
+        _store_date_taken(key, date_taken)
+    return date_taken or None
+
+
+def read_dates_taken(filepaths):
+    """
+    Extract 'Date Taken' for many files, using the same caches as read_date_taken.
+    Files not cached are read in a thread pool, or in a process pool for large
+    batches with RAW files, where tag parsing is CPU-bound.
+    Returns list of datetime objects (or None), in filepaths order.
+    """
+    results = [None] * len(filepaths)
+    pending = []
+    for i, filepath in enumerate(filepaths):
+        filepath = os.path.normpath(filepath)
+        key = _date_taken_key(filepath)
+        if key is None:
+            continue
+        found, date_taken = _lookup_date_taken(key)
+        if found:
+            results[i] = date_taken
+        else:
+            pending.append((i, filepath, key))
+    
+    paths = [filepath for _, filepath, _ in pending]
+    if (EXIFREAD_AVAILABLE and len(paths) >= PROCESS_POOL_MIN_FILES
+            and any(os.path.splitext(p)[1].lower() in RAW_EXTENSIONS for p in paths)):
+        # Workers only receive the path and return the datetime; caching stays here
+        executor = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, PROCESS_POOL_MAX_WORKERS))
+        chunksize = PROCESS_POOL_CHUNKSIZE
+    else:
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        chunksize = 1
+    
+    with executor:
+        dates = executor.map(_read_date_taken_uncached, paths, chunksize=chunksize)
+        for (i, _, key), date_taken in zip(pending, dates):
+            results[i] = date_taken or None
+            _store_date_taken(key, date_taken)
+    return results
+
+
+def _read_date_taken_uncached(filepath):
+    """
+    Read Date Taken from filepath with the readers for its extension (no caching).
+    Returns datetime object, False if the file has no Date Taken, or None if it
+    could not be read.
+    """
     ext = os.path.splitext(filepath)[1].lower()
     
-    # Try exifread first (better for RAW files)
-    if EXIFREAD_AVAILABLE:
-        try:
-            with open(filepath, 'rb') as f:
-                tags = exifread.process_file(f, details=False, stop_tag='EXIF DateTimeOriginal')
-                if 'EXIF DateTimeOriginal' in tags:
-                    date_str = str(tags['EXIF DateTimeOriginal'])
-                    return datetime.datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
-        except Exception as e:
-            print_verbose(f"exifread failed for {filepath}: {e}")
-    
-    # Try Pillow as fallback (good for JPEG/PNG/TIFF)
-    if PIL_AVAILABLE and ext in {'.jpg', '.jpeg', '.png', '.tiff', '.tif'}:
-        try:
-            with Image.open(filepath) as img:
-                exif_data = img._getexif()
-                if exif_data:
-                    for tag_id, value in exif_data.items():
-                        tag = TAGS.get(tag_id, tag_id)
-                        if tag == 'DateTimeOriginal':
-                            return datetime.datetime.strptime(value, '%Y:%m:%d %H:%M:%S')
-        except Exception as e:
-            print_verbose(f"Pillow failed for {filepath}: {e}")
+    for reader in _EXIF_STRATEGY.get(ext, (_read_date_taken_exifread,)):
+        date_taken = reader(filepath)
+        if date_taken is not None:
+            # A reader that parsed the file but found no tag (False) is final
+            return date_taken
+    
+    return None
+
+
+def _parse_tiff_date_taken(tiff):
+    """
+    Extract DateTimeOriginal from a TIFF-structured Exif block (header + IFDs).
+    Returns datetime object, False if the block has no DateTimeOriginal,
+    or None if the block could not be parsed.
+    """
+    # TIFF header: byte order, magic 42, offset of IFD0
+    if tiff[:2] == b'II':
+        endian = '<'
+    elif tiff[:2] == b'MM':
+        endian = '>'
+    else:
+        return None
+    magic, ifd0_offset = struct.unpack_from(endian + 'HI', tiff, 2)
+    if magic != 42:
+        return None
+    
+    # IFD0 -> ExifIFD pointer (0x8769) -> DateTimeOriginal (0x9003, ASCII)
+    exif_pointer = _find_ifd_tag(tiff, ifd0_offset, 0x8769, endian)
+    if exif_pointer is None:
+        return False
+    date_entry = _find_ifd_tag(tiff, exif_pointer[2], 0x9003, endian)
+    if date_entry is None:
+        return False
+    if date_entry[0] != 2 or date_entry[1] < 19:
+        return None
+    
+    _, count, value_offset = date_entry
+    date_str = tiff[value_offset:value_offset + count].rstrip(b'\x00 ').decode('ascii')
+    return _parse_exif_dt(date_str)
+
+
+def _read_date_taken_jpeg_fast(filepath):
+    """
+    Extract DateTimeOriginal from a JPEG by parsing only its APP1 (Exif) segment.
+    Reads the first 64KB of the file, where the Exif segment normally lives.
+    Returns datetime object, False if the JPEG has no DateTimeOriginal,
+    or None if it could not be parsed (the other readers are tried then).
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read(65536)
+        
+        if data[:2] != b'\xff\xd8':
+            return None
+        
+        # Walk the marker segments up to the start of scan
+        pos = 2
+        while pos + 4 <= len(data):
+            if data[pos] != 0xFF:
+                return None
+            marker = data[pos + 1]
+            if marker == 0xFF:
+                pos += 1  # Fill byte
+                continue
+            if marker == 0xDA:
+                return False  # Start of scan: no Exif segment in this file
+            (length,) = struct.unpack_from('>H', data, pos + 2)
+            if marker == 0xE1 and data[pos + 4:pos + 10] == b'Exif\x00\x00':
+                return _parse_tiff_date_taken(data[pos + 10:pos + 2 + length])
+            pos += 2 + length
+    except Exception as e:
+        print_verbose(f"JPEG Exif parse failed for {filepath}: {e}")
+    
+    return None
+
+
+def _read_date_taken_png(filepath):
+    """
+    Extract DateTimeOriginal from a PNG eXIf chunk.
+    Only chunk headers are read; image data chunks are skipped with seek.
+    Returns datetime object, False if the file has no eXIf chunk or no
+    DateTimeOriginal in it, or None if it could not be parsed.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            if f.read(8) != b'\x89PNG\r\n\x1a\n':
+                return None
+            
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                length, chunk_type = struct.unpack('>I4s', header)
+                if chunk_type == b'eXIf':
+                    return _parse_tiff_date_taken(f.read(length))
+                if chunk_type == b'IEND':
+                    return False
+                f.seek(length + 4, os.SEEK_CUR)  # Chunk data + CRC
+    except Exception as e:
+        print_verbose(f"PNG eXIf parse failed for {filepath}: {e}")
+    
+    return None
+
+
+def _read_date_taken_exifread(filepath):
+    """
+    Extract DateTimeOriginal with exifread.
+    Returns datetime object, False if the EXIF data has no such tag, or None on failure.
+    """
+    if not EXIFREAD_AVAILABLE:
+        return None
+    
+    ext = os.path.splitext(filepath)[1].lower()
+    try:
+        with open(filepath, 'rb') as f:
+            fh = io.BytesIO(f.read(EXIFREAD_HEAD_BYTES)) if ext in {'.jpg', '.jpeg'} else f
+            # exifread compares stop_tag against the bare tag name (no IFD prefix)
+            tags = exifread.process_file(fh, details=False, stop_tag='DateTimeOriginal')
+            if 'EXIF DateTimeOriginal' in tags:
+                date_str = str(tags['EXIF DateTimeOriginal'])
+                return _parse_exif_dt(date_str)
+            # No tags at all may also mean exifread did not recognise the format
+            if tags:
+                return False
+    except Exception as e:
+        print_verbose(f"exifread failed for {filepath}: {e}")
+    
+    return None
+
+
+def _read_date_taken_pillow(filepath):
+    """
+    Extract DateTimeOriginal with Pillow.
+    Returns datetime object, False if the image has no such tag, or None on failure.
+    """
+    if not PIL_AVAILABLE:
+        return None
+    
+    try:
+        with Image.open(filepath) as img:
+            exif_data = img._getexif()
+            if exif_data:
+                for tag_id, value in exif_data.items():
+                    tag = TAGS.get(tag_id, tag_id)
+                    if tag == 'DateTimeOriginal':
+                        return _parse_exif_dt(value)
+            return False
+    except Exception as e:
+        print_verbose(f"Pillow failed for {filepath}: {e}")
     
     return None
 
 
+# Date Taken readers to try, in order, per extension. Each reader returns a
+# datetime, False when it parsed the file and the tag is definitely absent (no
+# further readers are tried), or None when it could not parse the file.
+# RAW formats default to exifread only, since Pillow cannot decode them.
+_EXIF_STRATEGY = {ext: (_read_date_taken_exifread,) for ext in IMAGE_EXTENSIONS}
+_EXIF_STRATEGY.update({
+    # Direct APP1 parse first (only reads one tag), then the libraries
+    '.jpg': (_read_date_taken_jpeg_fast, _read_date_taken_exifread, _read_date_taken_pillow),
+    '.jpeg': (_read_date_taken_jpeg_fast, _read_date_taken_exifread, _read_date_taken_pillow),
+    # PNG rarely has Exif: only look for an eXIf chunk
+    '.png': (_read_date_taken_png,),
+    '.tiff': (_read_date_taken_exifread, _read_date_taken_pillow),
+    '.tif': (_read_date_taken_exifread, _read_date_taken_pillow),
+})
+
+
 def parse_filename_date(filename):
     """
     Parse date/time from filename.
@@ -144,39 +547,35 @@ def parse_filename_date(filename):
     """
     basename = os.path.splitext(os.path.basename(filename))[0]
     
-    # Pattern: YYYY-MM-DD HH-MM-SS or YYYY-MM-DD_HH-MM-SS or YYYY-MM-DD HH.MM.SS
-    # Time separators can be - or . 
-    # Anything after the seconds (like -3, -1) is ignored
-    pattern1 = r'^(\d{4})-(\d{2})-(\d{2})[\s_](\d{2})[-.](\d{2})[-.](\d{2})'
-    match = re.match(pattern1, basename)
-    if match:
-        y, m, d, h, mi, s = map(int, match.groups())
-        try:
-            return datetime.datetime(y, m, d, h, mi, s)
-        except ValueError:
-            pass
-    
-    # Pattern: YYYYMMDD_HHMMSS
-    pattern2 = r'^(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})'
-    match = re.match(pattern2, basename)
-    if match:
-        y, m, d, h, mi, s = map(int, match.groups())
-        try:
-            return datetime.datetime(y, m, d, h, mi, s)
-        except ValueError:
-            pass
-    
-    # Pattern: YYYY-MM-DD (date only, must be end of filename)
-    pattern3 = r'^(\d{4})-(\d{2})-(\d{2})$'
-    match = re.match(pattern3, basename)
-    if match:
-        y, m, d = map(int, match.groups())
-        try:
-            return datetime.datetime(y, m, d, 0, 0, 0)
-        except ValueError:
-            pass
+    n = len(basename)
     
-    return None
+    # Formats are fixed-width, so check separators by position and slice the fields
+    if n >= 10 and basename[4] == '-' and basename[7] == '-':
+        y, m, d = basename[0:4], basename[5:7], basename[8:10]
+        if n == 10:
+            # YYYY-MM-DD (date only, must be end of filename)
+            h, mi, s = '0', '0', '0'
+        elif (n >= 19 and (basename[10] == '_' or basename[10].isspace())
+              and basename[13] in '-.' and basename[16] in '-.'):
+            # YYYY-MM-DD HH-MM-SS or YYYY-MM-DD_HH-MM-SS or YYYY-MM-DD HH.MM.SS
+            # Anything after the seconds (like -3, -1) is ignored
+            h, mi, s = basename[11:13], basename[14:16], basename[17:19]
+        else:
+            return None
+    elif n >= 15 and basename[8] == '_':
+        # YYYYMMDD_HHMMSS
+        y, m, d = basename[0:4], basename[4:6], basename[6:8]
+        h, mi, s = basename[9:11], basename[11:13], basename[13:15]
+    else:
+        return None
+    
+    if not (y + m + d + h + mi + s).isdecimal():
+        return None
+    
+    try:
+        return datetime.datetime(int(y), int(m), int(d), int(h), int(mi), int(s))
+    except ValueError:
+        return None
 
 
 def check_mismatch(filepath, tolerance_seconds=2):
@@ -196,30 +595,110 @@ def check_mismatch(filepath, tolerance_seconds=2):
     return (has_mismatch, filename_date, exif_date)
 
 
-def get_unique_filename(directory, base_name, extension):
+def check_mismatches(filepaths, tolerance_seconds=2):
+    """
+    Compare filename dates with EXIF metadata dates for many files.
+    Metadata is read in parallel (read_dates_taken); the dates are then compared in one pass.
+    Returns list of (has_mismatch, filename_date, exif_date) tuples, in filepaths order.
+    """
+    filename_dates = [parse_filename_date(p) for p in filepaths]
+    exif_dates = read_dates_taken(filepaths)
+    
+    return [
+        (None, fn_date, ex_date) if fn_date is None or ex_date is None
+        else (abs((fn_date - ex_date).total_seconds()) > tolerance_seconds, fn_date, ex_date)
+        for fn_date, ex_date in zip(filename_dates, exif_dates)
+    ]
+
+
+def list_taken_names(directory):
+    """
+    Get the names present in directory, lowercased so that collisions are also
+    caught on case-insensitive filesystems.
+    Returns a Counter of names or None if the directory cannot be read.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return collections.Counter(entry.name.lower() for entry in it)
+    except OSError as e:
+        print_verbose(f"Cannot read directory {directory}: {e}")
+        return None
+
+
+def get_unique_filename(directory, base_name, extension, taken):
     """
     Get unique filename with counter suffix if collision exists.
+    taken: Counter of lowercased names already used in directory (see list_taken_names).
     Returns the full path with unique name.
     """
-    new_path = os.path.join(directory, base_name + extension)
+    new_name = base_name + extension
     
-    if not os.path.exists(new_path):
-        return new_path
+    if not taken[new_name.lower()]:
+        return os.path.join(directory, new_name)
     
     # Add counter suffix
     counter = 1
     while True:
         new_name = f"{base_name}_{counter:03d}{extension}"
-        new_path = os.path.join(directory, new_name)
-        if not os.path.exists(new_path):
-            return new_path
+        if not taken[new_name.lower()]:
+            return os.path.join(directory, new_name)
         counter += 1
         if counter > 9999:
             raise Exception("Too many files with same timestamp")
 
 
+def open_log_file():
+    """Open the log file for appending once and reuse the handle for the rest of the run."""
+    global _log_fh
+    
+    if _log_fh is None:
+        _log_fh = open(log_file_path, 'a', encoding='utf-8', buffering=1)
+        atexit.register(_log_fh.close)
+    return _log_fh
+
+
+def _log_writer():
+    """Background thread: write queued log entries in batches until a None sentinel."""
+    while True:
+        batch = [_log_queue.get()]
+        # Take everything else already queued so it goes out in one write
+        while True:
+            try:
+                batch.append(_log_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        done = None in batch
+        entries = [entry for entry in batch if entry is not None]
+        if entries:
+            _log_fh.write(''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in entries))
+        if done:
+            break
+
+
+def start_log_writer():
+    """Open the log file and start the background writer thread (once per run)."""
+    global _log_thread
+    
+    if _log_thread is None:
+        open_log_file()
+        _log_thread = threading.Thread(target=_log_writer, daemon=True)
+        _log_thread.start()
+        atexit.register(stop_log_writer)
+
+
+def stop_log_writer():
+    """Write out all queued log entries and stop the writer thread."""
+    global _log_thread
+    
+    if _log_thread is not None:
+        _log_queue.put(None)
+        _log_thread.join()
+        _log_thread = None
+
+
 def log_rename(original_path, new_path):
-    """Append rename operation to JSON log file."""
+    """Append rename operation to JSON Lines log file."""
     global log_file_path
     
     if not log_mode:
@@ -231,86 +710,179 @@ def log_rename(original_path, new_path):
         "timestamp": datetime.datetime.now().isoformat()
     }
     
-    # Read existing log or create new
-    log_data = []
-    if os.path.exists(log_file_path):
-        try:
-            with open(log_file_path, 'r', encoding='utf-8') as f:
-                log_data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            log_data = []
-    
-    log_data.append(log_entry)
-    
-    with open(log_file_path, 'w', encoding='utf-8') as f:
-        json.dump(log_data, f, indent=2, ensure_ascii=False)
+    # Append-only JSON Lines, written by the background writer thread
+    start_log_writer()
+    _log_queue.put(log_entry)
     
     print_verbose(f"Logged rename: {original_path} -> {new_path}")
 
 
-def rename_file_by_date(filepath, use_metadata=False):
+def plan_rename(filepath, use_metadata=False, prefetched_dates=None, taken_names=None):
     """
-    Rename file by date (modified date or metadata date).
-    Handles collision and logging based on global options.
+    Work out the new name for a file by date (modified date or metadata date).
+    Handles collision based on global options; nothing is renamed here.
+    prefetched_dates: optional {path: Date Taken} dict of already read metadata dates.
+    taken_names: optional {directory: taken names} dict shared by a batch of planned
+    renames, so names assigned to earlier files count as taken; updated in place.
+    Returns tuple: (new_path, date_source) or None if the file should not be renamed.
     """
     filepath = os.path.normpath(filepath)
-    directory = os.path.dirname(filepath)
+    directory = os.path.dirname(filepath) or os.curdir
     filename = os.path.basename(filepath)
     extension = os.path.splitext(filename)[1]
     
     # Skip the script itself
     if filepath == os.path.abspath(__file__):
         print_verbose('Skipping the script itself.')
-        return
+        return None
     
-    if not os.path.exists(filepath):
+    # Skip the rename log
+    if log_file_path and os.path.abspath(filepath) == os.path.abspath(log_file_path):
+        print_verbose('Skipping the rename log.')
+        return None
+    
+    # One stat call serves the existence, file type and modified time checks
+    try:
+        st = os.stat(filepath)
+    except OSError:
         print_error(f'Path not found: {filepath}')
-        return
+        return None
     
-    if not os.path.isfile(filepath):
-        return  # Skip directories
+    if not stat.S_ISREG(st.st_mode):
+        return None  # Skip directories
     
     # Get the date to use
     if use_metadata:
-        if not is_image_file(filepath):
-            print_verbose(f'Skipping non-image file: {filename}')
-            return
-        
-        target_date = read_date_taken(filepath)
+        if prefetched_dates is not None and filepath in prefetched_dates:
+            # Already filtered to image files by the caller
+            target_date = prefetched_dates[filepath]
+        else:
+            if not is_image_file(filepath):
+                print_verbose(f'Skipping non-image file: {filename}')
+                return None
+            target_date = read_date_taken(filepath)
         if target_date is None:
             print_warning(f'No Date Taken found for: {filename}')
-            return
+            return None
         date_source = "Date Taken"
     else:
-        modified_time = os.path.getmtime(filepath)
+        modified_time = st.st_mtime
         target_date = datetime.datetime.fromtimestamp(modified_time)
         date_source = "modified"
     
     # Create new filename
     base_name = target_date.strftime('%Y-%m-%d %H-%M-%S')
     
+    # Names in the directory, including names planned for earlier files
+    if taken_names is None:
+        taken_names = {}
+    if directory not in taken_names:
+        taken_names[directory] = list_taken_names(directory)
+    taken = taken_names[directory]
+    if taken is None:
+        # Without the listing every name would look free
+        print_warning(f'Cannot list {directory} to check for collisions. Skipping {filename}')
+        return None
+    
+    # The file's current name is free for itself (it moves away when renamed).
+    # Names differing only in case share a key on a case-sensitive filesystem,
+    # so the name is only free once no other file still holds it (count 0).
+    own_name = filename.lower()
+    if taken[own_name] > 0:
+        taken[own_name] -= 1
+    
     if safe_mode:
-        new_path = get_unique_filename(directory, base_name, extension)
+        new_path = get_unique_filename(directory, base_name, extension, taken)
     else:
         new_path = os.path.join(directory, base_name + extension)
-        if os.path.exists(new_path) and new_path != filepath:
+        if taken[os.path.basename(new_path).lower()]:
             print_warning(f'Collision: {new_path} already exists. Skipping {filename}')
-            return
+            taken[own_name] += 1
+            return None
     
     # Skip if same path
     if os.path.normpath(new_path) == os.path.normpath(filepath):
         print_verbose(f'Already named correctly: {filename}')
-        return
+        taken[own_name] += 1
+        return None
+    
+    taken[os.path.basename(new_path).lower()] += 1
+    return (new_path, date_source)
+
+
+def apply_rename(filepath, new_path, date_source, dir_fd=None):
+    """
+    Perform (or preview in dry-run mode) a planned rename and log it.
+    dir_fd: optional descriptor of the directory holding both names; the rename
+    then uses names relative to it instead of resolving both full paths.
+    """
+    filename = os.path.basename(filepath)
     
-    # Perform or preview rename
     if dry_run_mode:
         print(f"{Fore.CYAN}[DRY-RUN]{Style.RESET_ALL} Would rename: {filename} -> {os.path.basename(new_path)} ({date_source} date)")
     else:
-        os.rename(filepath, new_path)
+        if dir_fd is not None:
+            os.rename(filename, os.path.basename(new_path), src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+        else:
+            os.rename(filepath, new_path)
         log_rename(filepath, new_path)
         print_success(f'Renamed: {filename} -> {os.path.basename(new_path)} ({date_source} date)')
 
 
+def rename_file_by_date(filepath, use_metadata=False):
+    """
+    Rename file by date (modified date or metadata date).
+    Handles collision and logging based on global options.
+    """
+    plan = plan_rename(filepath, use_metadata)
+    if plan is not None:
+        apply_rename(os.path.normpath(filepath), *plan)
+
+
+def check_directory(paths):
+    """Check image files for mismatches, report them in order and print a summary."""
+    mismatches_found = 0
+    
+    # Compare all files first, then report in walk order
+    for full_path, result in zip(paths, check_mismatches(paths)):
+        if check_and_report_file(full_path, result):
+            mismatches_found += 1
+    
+    print(f"\n{Style.BRIGHT}Summary:{Style.RESET_ALL}")
+    print(f"  Images checked: {len(paths)}")
+    print(f"  Mismatches found: {Fore.MAGENTA}{mismatches_found}{Style.RESET_ALL}" if mismatches_found > 0 
+          else f"  Mismatches found: {Fore.GREEN}0{Style.RESET_ALL}")
+
+
+def rename_directory(paths, use_metadata=False):
+    """Rename files by date: read all dates, plan all new names, then rename."""
+    # Phase 1: read all dates (metadata reads run in parallel)
+    prefetched_dates = None
+    if use_metadata:
+        # Keyed like plan_rename looks them up ('./a.jpg' becomes 'a.jpg')
+        prefetched_dates = {os.path.normpath(path): date_taken
+                            for path, date_taken in zip(paths, read_dates_taken(paths))}
+    
+    # Phase 2: assign every new name up-front, before touching the directory
+    taken_names = {}
+    plan = []
+    for full_path in paths:
+        planned = plan_rename(full_path, use_metadata, prefetched_dates, taken_names)
+        if planned is not None:
+            plan.append((full_path,) + planned)
+    
+    # Phase 3: rename in one pass, directory by directory
+    use_dir_fd = not dry_run_mode and os.rename in os.supports_dir_fd
+    for directory, renames in itertools.groupby(plan, key=lambda item: os.path.dirname(item[0])):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY) if use_dir_fd else None
+        try:
+            for full_path, new_path, date_source in renames:
+                apply_rename(full_path, new_path, date_source, dir_fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+
 def process_path(filepath, action='modified'):
     """
     Process a file or directory.
@@ -328,40 +900,31 @@ def process_path(filepath, action='modified'):
         else:
             rename_file_by_date(filepath, use_metadata=(action == 'metadata'))
     else:
-        # Directory: process all files recursively
-        files_processed = 0
-        mismatches_found = 0
-        
-        for root, _, files in os.walk(filepath):
-            for file in files:
-                full_path = os.path.join(root, file)
-                
-                if action == 'check':
-                    if is_image_file(full_path):
-                        result = check_and_report_file(full_path)
-                        files_processed += 1
-                        if result:
-                            mismatches_found += 1
-                else:
-                    if action == 'metadata' and not is_image_file(full_path):
-                        continue
-                    rename_file_by_date(full_path, use_metadata=(action == 'metadata'))
-                    files_processed += 1
-        
+        # Directory: the action is resolved once here; the walker filters by
+        # extension and the handlers loop over files without per-file dispatch
+        if action != 'modified':
+            _neg_cache_roots.add(os.path.abspath(filepath))
         if action == 'check':
-            print(f"\n{Style.BRIGHT}Summary:{Style.RESET_ALL}")
-            print(f"  Images checked: {files_processed}")
-            print(f"  Mismatches found: {Fore.MAGENTA}{mismatches_found}{Style.RESET_ALL}" if mismatches_found > 0 
-                  else f"  Mismatches found: {Fore.GREEN}0{Style.RESET_ALL}")
+            check_directory([entry.path for entry in iter_files(filepath, IMAGE_EXTENSIONS)])
+        elif action == 'metadata':
+            rename_directory([entry.path for entry in iter_files(filepath, IMAGE_EXTENSIONS)],
+                             use_metadata=True)
+        else:
+            rename_directory([entry.path for entry in iter_files(filepath)])
 
 
-def check_and_report_file(filepath):
-    """Check single file for mismatch and report. Returns True if mismatch found."""
-    if not is_image_file(filepath):
-        return False
+def check_and_report_file(filepath, result=None):
+    """
+    Check single file for mismatch and report. Returns True if mismatch found.
+    result: optional check_mismatch() tuple already computed for this (image) file.
+    """
+    if result is None:
+        if not is_image_file(filepath):
+            return False
+        result = check_mismatch(filepath)
     
     filename = os.path.basename(filepath)
-    has_mismatch, filename_date, exif_date = check_mismatch(filepath)
+    has_mismatch, filename_date, exif_date = result
     
     if has_mismatch is None:
         if exif_date is None:
@@ -497,7 +1060,7 @@ Examples:
     parser.add_argument('-s', '--safe', action='store_true',
                         help='Add counter suffix on name collision (e.g., _001)')
     parser.add_argument('-l', '--log', action='store_true',
-                        help='Save rename operations to rename_log.json')
+                        help='Save rename operations to rename_log.jsonl')
     parser.add_argument('-v', '--verbose', action='store_true',
                         help='Show detailed output')
     
@@ -528,9 +1091,9 @@ Examples:
     
     # Set log file path
     if os.path.isdir(target_path):
-        log_file_path = os.path.join(target_path, 'rename_log.json')
+        log_file_path = os.path.join(target_path, 'rename_log.jsonl')
     else:
-        log_file_path = os.path.join(os.path.dirname(target_path), 'rename_log.json')
+        log_file_path = os.path.join(os.path.dirname(target_path), 'rename_log.jsonl')
     
     # Execute action
     if args.modified: